@@ -15,6 +15,9 @@ RARITY_PREFIXES = {
     "founder": "f",
 }
 
+# Extensions (lowercase) that count as card images
+CARD_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".webp"})
+
 for rarity, prefix in RARITY_PREFIXES.items():
     folder = os.path.join(CARDS_ROOT, rarity)
     if not os.path.isdir(folder):
@@ -23,10 +26,10 @@ for rarity, prefix in RARITY_PREFIXES.items():
     count = 1
     for fname in files:
         # Only rename image files (skip folders, etc.)
-        if not fname.lower().endswith(('.png', '.jpg', '.jpeg', '.webp')):
+        ext = os.path.splitext(fname)[1].lower()
+        if ext not in CARD_EXTENSIONS:
             continue
-        ext = os.path.splitext(fname)[1]
-        new_name = f"{prefix}{count:04d}{ext.lower()}"
+        new_name = f"{prefix}{count:04d}{ext}"
         old_path = os.path.join(folder, fname)
         new_path = os.path.join(folder, new_name)
         if old_path != new_path: